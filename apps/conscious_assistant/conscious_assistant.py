@@ -21,6 +21,26 @@ from neuro_san.client.streaming_input_processor import StreamingInputProcessor
 
 AGENT_NETWORK_NAME = "conscious_agent"
 
+# One StreamingInputProcessor per session, reused across turns the way agent_cli.py does
+_input_processors = {}
+
+
+def _get_input_processor(session):
+    """Return the StreamingInputProcessor for this session, creating it on first use.
+
+    :param session: The agent session the processor talks to.
+    """
+    input_processor = _input_processors.get(session)
+    if input_processor is None:
+        input_processor = StreamingInputProcessor(
+            "DEFAULT",
+            "/tmp/agent_thinking.txt",  # Or wherever you want
+            session,
+            None,  # Not using a thinking_dir for simplicity
+        )
+        _input_processors[session] = input_processor
+    return input_processor
+
 
 def set_up_conscious_assistant():
     """Configure these as needed."""
@@ -52,7 +72,7 @@ def conscious_thinker(conscious_session, conscious_thread, thoughts):
     Processes a single turn of user input within the conscious agent's session.
 
     This function simulates a conversational turn by:
-    1. Initializing a StreamingInputProcessor to handle the input.
+    1. Fetching the session's StreamingInputProcessor to handle the input.
     2. Updating the agent's internal thread state with the user's input (`thoughts`).
     3. Passing the updated thread to the processor for handling.
     4. Extracting and returning the agent's response for this turn.
@@ -68,12 +88,7 @@ def conscious_thinker(conscious_session, conscious_thread, thoughts):
             - conscious_thread (dict): The updated thread state after processing.
     """
     # Use the processor (like in agent_cli.py)
-    input_processor = StreamingInputProcessor(
-        "DEFAULT",
-        "/tmp/agent_thinking.txt",  # Or wherever you want
-        conscious_session,
-        None,  # Not using a thinking_dir for simplicity
-    )
+    input_processor = _get_input_processor(conscious_session)
     # Update the conversation state with this turn's input
     conscious_thread["user_input"] = thoughts
     conscious_thread = input_processor.process_once(conscious_thread)
@@ -88,6 +103,7 @@ def tear_down_conscious_assistant(conscious_session):
     :param conscious_session: The pointer to the session.
     """
     print("tearing down conscious assistant...")
+    _input_processors.pop(conscious_session, None)
     conscious_session.close()
     # client.assistants.delete(conscious_assistant_id)
     print("conscious assistant torn down.")
@@ -25,6 +25,7 @@ from datetime import datetime
 import schedule
 from flask import Flask
 from flask import render_template
+from flask import request
 from flask_socketio import SocketIO
 
 from apps.conscious_assistant.conscious_assistant import conscious_thinker
@@ -38,6 +39,9 @@ app.config["SECRET_KEY"] = "secret!"
 socketio = SocketIO(app)
 thread_started = False  # pylint: disable=invalid-name
 
+# Idempotent GET endpoints that clients may cache and revalidate by ETag instead of refetching
+REVALIDATED_ENDPOINTS = {"static"}
+
 user_input_queue = queue.Queue()
 
 conscious_session, conscious_thread = set_up_conscious_assistant()
@@ -60,6 +64,9 @@ def conscious_thinking_process():
             thoughts_to_emit = []
             speeches_to_emit = []
 
+            # One timestamp per turn, shared by every block in it and by the next user line
+            timestamp = datetime.now().strftime("[%I:%M:%S%p]").lower()
+
             # --- 1.  Slice the input into blocks ----------------------------------------
             #     Each block begins with  "thought:"  or  "say:"  and continues until
             #     the next block or the end of the string.
@@ -74,27 +81,19 @@ def conscious_thinking_process():
                     continue
 
                 if kind == "thought":
-                    timestamp = datetime.now().strftime("[%I:%M:%S%p]").lower()
                     thoughts_to_emit.append(f"{timestamp} thought: {content}")
                 else:  # kind == "say"
                     speeches_to_emit.append(content)
 
-            # --- 2.  Emit the blocks -----------------------------------------------------
+            # --- 2.  Emit the blocks together in a single frame ------------------------
+            turn = {}
             if thoughts_to_emit:
-                socketio.emit(
-                    "update_thoughts",
-                    {"data": "\n".join(thoughts_to_emit)},
-                    namespace="/chat",
-                )
-
+                turn["thoughts"] = "\n".join(thoughts_to_emit)
             if speeches_to_emit:
-                socketio.emit(
-                    "update_speech",
-                    {"data": "\n".join(speeches_to_emit)},
-                    namespace="/chat",
-                )
+                turn["speech"] = "\n".join(speeches_to_emit)
+            if turn:
+                socketio.emit("update_turn", turn, namespace="/chat")
 
-            timestamp = datetime.now().strftime("[%I:%M:%S%p]").lower()
             thoughts = f"\n{timestamp} user: " + "[Silence]"
             try:
                 user_input = user_input_queue.get(timeout=0.1)
@@ -152,7 +151,10 @@ def shutdown():
 @app.after_request
 def add_header(response):
     """Add the header."""
-    response.headers["Cache-Control"] = "no-store"
+    if request.endpoint in REVALIDATED_ENDPOINTS:
+        response.headers["Cache-Control"] = "no-cache"
+    else:
+        response.headers["Cache-Control"] = "no-store"
     return response
 
 
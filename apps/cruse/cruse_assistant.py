@@ -22,6 +22,26 @@ from pyhocon import ConfigFactory
 
 AGENT_NETWORK_NAME = "cruse_agent"
 
+# One StreamingInputProcessor per session, reused across turns the way agent_cli.py does
+_input_processors = {}
+
+
+def _get_input_processor(session):
+    """Return the StreamingInputProcessor for this session, creating it on first use.
+
+    :param session: The agent session the processor talks to.
+    """
+    input_processor = _input_processors.get(session)
+    if input_processor is None:
+        input_processor = StreamingInputProcessor(
+            "DEFAULT",
+            "/tmp/agent_thinking.txt",  # Or wherever you want
+            session,
+            None,  # Not using a thinking_dir for simplicity
+        )
+        _input_processors[session] = input_processor
+    return input_processor
+
 
 def set_up_cruse_assistant(selected_agent):
     """Configure these as needed."""
@@ -56,7 +76,7 @@ def cruse(cruse_session, cruse_state_info, user_input):
     Processes a single turn of user input within the cruse_agent agent's session.
 
     This function simulates a conversational turn by:
-    1. Initializing a StreamingInputProcessor to handle the input.
+    1. Fetching the session's StreamingInputProcessor to handle the input.
     2. Updating the agent's internal state with the user's input (`thoughts`).
     3. Passing the updated state to the processor for handling.
     4. Extracting and returning the agent's response for this turn.
@@ -72,12 +92,7 @@ def cruse(cruse_session, cruse_state_info, user_input):
             - cruse_state_info (dict): The updated state after processing.
     """
     # Use the processor (like in agent_cli.py)
-    input_processor = StreamingInputProcessor(
-        "DEFAULT",
-        "/tmp/agent_thinking.txt",  # Or wherever you want
-        cruse_session,
-        None,  # Not using a thinking_dir for simplicity
-    )
+    input_processor = _get_input_processor(cruse_session)
     # Update the conversation state with this turn's input
     cruse_state_info["user_input"] = user_input
     cruse_state_info = input_processor.process_once(cruse_state_info)
@@ -92,6 +107,7 @@ def tear_down_cruse_assistant(cruse_session):
     :param cruse_session: The pointer to the session.
     """
     print("tearing down cruse_agent assistant...")
+    _input_processors.pop(cruse_session, None)
     cruse_session.close()
     # client.assistants.delete(cruse_assistant_id)
     print("cruse_agent assistant torn down.")
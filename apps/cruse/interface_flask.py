@@ -17,12 +17,14 @@
 import atexit
 import os
 import queue
+import threading
 
 # pylint: disable=import-error
 import schedule
 from flask import Flask
 from flask import jsonify
 from flask import render_template
+from flask import request
 from flask_socketio import SocketIO
 
 from apps.cruse.cruse_assistant import cruse
@@ -39,10 +41,31 @@ app.config["SECRET_KEY"] = "secret!"
 socketio = SocketIO(app, ping_timeout=360, ping_interval=25)
 thread_started = False  # pylint: disable=invalid-name
 
+# Idempotent GET endpoints that clients may cache and revalidate by ETag instead of refetching
+REVALIDATED_ENDPOINTS = {"static", "systems"}
+
 user_input_queue = queue.Queue()
 gui_context_queue = queue.Queue()
 
 cruse_session, cruse_agent_state = set_up_cruse_assistant(get_available_systems()[0])
+# Guards cruse_session and cruse_agent_state, which the thinking loop, new_chat and cleanup all touch
+session_lock = threading.Lock()
+
+
+def emit_turn(gui_to_emit, speeches_to_emit):
+    """
+    Send the gui and speech for one turn together in a single frame.
+
+    :param gui_to_emit: List of gui blocks from the response
+    :param speeches_to_emit: List of speech blocks from the response
+    """
+    turn = {}
+    if gui_to_emit:
+        turn["gui"] = "\n".join(gui_to_emit)
+    if speeches_to_emit:
+        turn["speech"] = "\n".join(speeches_to_emit)
+    if turn:
+        socketio.emit("update_turn", turn, namespace="/chat")
 
 
 def cruse_thinking_process():
@@ -60,7 +83,10 @@ def cruse_thinking_process():
 
             if user_input or gui_context:
                 print(f"USER INPUT:{user_input}\n\nGUI CONTEXT:{gui_context}\n")
-                response, cruse_agent_state = cruse(cruse_session, cruse_agent_state, user_input + str(gui_context))
+                with session_lock:
+                    response, cruse_agent_state = cruse(
+                        cruse_session, cruse_agent_state, user_input + str(gui_context)
+                    )
                 print(response)
 
                 blocks = parse_response_blocks(response)
@@ -80,11 +106,7 @@ def cruse_thinking_process():
                 if not blocks and response.strip():
                     speeches_to_emit.append(response.strip())
 
-                if gui_to_emit:
-                    socketio.emit("update_gui", {"data": "\n".join(gui_to_emit)}, namespace="/chat")
-
-                if speeches_to_emit:
-                    socketio.emit("update_speech", {"data": "\n".join(speeches_to_emit)}, namespace="/chat")
+                emit_turn(gui_to_emit, speeches_to_emit)
 
             try:
                 user_input = user_input_queue.get_nowait()
@@ -133,13 +155,14 @@ def handle_gui_context(json, *_):
     """
     gui_context = json["gui_context"]
     gui_context_queue.put(gui_context)
-    socketio.emit("gui_context_input", {"gui_context": gui_context}, namespace="/chat")
 
 
 def cleanup():
     """Tear things down on exit."""
     print("Bye!")
-    tear_down_cruse_assistant(cruse_session)
+    # Wait for any in-flight turn to finish before closing the session under it
+    with session_lock:
+        tear_down_cruse_assistant(cruse_session)
     socketio.stop()
 
 
@@ -153,7 +176,10 @@ def shutdown():
 @app.after_request
 def add_header(response):
     """Add the header."""
-    response.headers["Cache-Control"] = "no-store"
+    if request.endpoint in REVALIDATED_ENDPOINTS:
+        response.headers["Cache-Control"] = "no-cache"
+    else:
+        response.headers["Cache-Control"] = "no-store"
     return response
 
 
@@ -166,7 +192,9 @@ def systems():
         Response: A JSON response containing a list of system names derived
                   from the manifest file.
     """
-    return jsonify(get_available_systems())
+    response = jsonify(get_available_systems())
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 def run_scheduled_tasks():
@@ -212,7 +240,7 @@ def handle_new_chat(data, *args):
     Notes:
     -----
     - If no valid agent is found and no available systems are returned, the function exits early.
-    - Relies on global variables: `cruse_session`, `cruse_agent_state`.
+    - Relies on global variables: `cruse_session`, `cruse_agent_state`, guarded by `session_lock`.
 
     """
     del args
@@ -237,8 +265,10 @@ def handle_new_chat(data, *args):
 
     print(f"Resetting session for new chat... Selected agent is: {selected_agent}")
 
-    tear_down_cruse_assistant(cruse_session)
-    cruse_session, cruse_agent_state = set_up_cruse_assistant(selected_agent)
+    # Wait for any in-flight turn to finish before swapping the session out from under it
+    with session_lock:
+        tear_down_cruse_assistant(cruse_session)
+        cruse_session, cruse_agent_state = set_up_cruse_assistant(selected_agent)
 
     print("****New chat started****")
 
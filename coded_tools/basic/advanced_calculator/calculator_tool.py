@@ -23,8 +23,6 @@ from typing import Union
 
 from neuro_san.interfaces.coded_tool import CodedTool
 
-# Configure default logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -14,7 +14,6 @@
 #
 # END COPYRIGHT
 
-import asyncio
 import json
 from typing import Any
 from typing import Dict
@@ -36,6 +35,25 @@ class ThemeTemplateProvider(CodedTool):
     CSS_DOODLE_TEMPLATES = CSS_DOODLE_TEMPLATES
     GRADIENT_TEMPLATES = GRADIENT_TEMPLATES
 
+    # The templates are static, so the result for each request_type is built once up front
+    RESULTS = {
+        "css-doodle": {
+            "css_doodle_templates": CSS_DOODLE_TEMPLATES,
+            "css_doodle_patterns": list(CSS_DOODLE_TEMPLATES.keys()),
+        },
+        "gradient": {"gradient_templates": GRADIENT_TEMPLATES},
+        "colors": {"color_palettes": COLOR_PALETTES},
+        "full": {
+            "css_doodle_templates": CSS_DOODLE_TEMPLATES,
+            "css_doodle_patterns": list(CSS_DOODLE_TEMPLATES.keys()),
+            "gradient_templates": GRADIENT_TEMPLATES,
+            "color_palettes": COLOR_PALETTES,
+        },
+    }
+
+    # Serialized once at import, since the JSON text for each request_type never changes either
+    SERIALIZED_RESULTS = {request_type: json.dumps(result, indent=2) for request_type, result in RESULTS.items()}
+
     def invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> str:
         """
         Provides background schema templates, css-doodle patterns,
@@ -56,21 +74,11 @@ class ThemeTemplateProvider(CodedTool):
         :return: JSON string containing requested information
         """
         request_type = args.get("request_type", "full")
-
-        result = {}
-
-        if request_type in ["css-doodle", "full"]:
-            result["css_doodle_templates"] = self.CSS_DOODLE_TEMPLATES
-            result["css_doodle_patterns"] = list(self.CSS_DOODLE_TEMPLATES.keys())
-
-        if request_type in ["gradient", "full"]:
-            result["gradient_templates"] = self.GRADIENT_TEMPLATES
-
-        if request_type in ["colors", "full"]:
-            result["color_palettes"] = self.COLOR_PALETTES
-
-        return json.dumps(result, indent=2)
+        return self.SERIALIZED_RESULTS.get(request_type, "{}")
 
     async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> str:
-        """Run invoke asynchronously."""
-        return await asyncio.to_thread(self.invoke, args, sly_data)
+        """
+        Returns the same precomputed result as invoke. The work is a table lookup,
+        so it is done inline rather than paying for a worker thread hop.
+        """
+        return self.invoke(args, sly_data)
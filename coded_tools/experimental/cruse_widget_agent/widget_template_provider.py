@@ -14,7 +14,6 @@
 #
 # END COPYRIGHT
 
-import asyncio
 import json
 from typing import Any
 from typing import Dict
@@ -276,6 +275,53 @@ class WidgetTemplateProvider(CodedTool):
         ],
     }
 
+    # Instructions for filling in the template, included in "full" responses
+    WIDGET_INSTRUCTIONS = {
+        "overview": "Generate widget definitions by filling in the template based on conversation context",
+        "widget_types": [
+            "text - Single-line text input (default for string type)",
+            "textarea - Multi-line text input (use x-ui.widget: 'textarea')",
+            "number - Numeric input (type: number or integer)",
+            "boolean - Toggle switch (type: boolean)",
+            "checkbox - Checkbox input (type: boolean with x-ui.widget: 'checkbox')",
+            "select - Dropdown selection (use enum array)",
+            "radio - Radio button group (use enum with x-ui.widget: 'radio')",
+            "multiselect - Multiple selection (type: array with items.enum)",
+            "date - Date picker (format: 'date' or 'date-time')",
+            "slider - Range slider (number with minimum, maximum, multipleOf)",
+            "rating - Star rating (number with x-ui.widget: 'rating')",
+            "file - File upload with drag-and-drop (use x-ui.widget: 'file' with accept, maxFiles, maxSize)",
+        ],
+        "key_points": [
+            "Replace <PLACEHOLDERS> with actual values from conversation",
+            "Remove example comments and unused optional fields",
+            "Use appropriate field types based on data requirements",
+            "Set 'required' array for mandatory fields",
+            "Choose meaningful icons and colors that match the context",
+            "Provide helpful descriptions and examples for clarity",
+            "Field descriptions are shown as help text once - avoid redundancy",
+            "Use format: 'date' for date pickers (no additional validation needed)",
+            "Only add validation (minDate, maxDate) when business logic requires it",
+            "Icons are displayed prominently - choose ones that match the widget purpose",
+        ],
+    }
+
+    # The templates are static, so the result for each request_type is built once up front
+    RESULTS = {
+        "template": {"template": WIDGET_SCHEMA_TEMPLATE},
+        "examples": {"widget_type_examples": WIDGET_TYPE_EXAMPLES},
+        "icons": {"icon_guidance": ICON_GUIDANCE},
+        "full": {
+            "template": WIDGET_SCHEMA_TEMPLATE,
+            "widget_type_examples": WIDGET_TYPE_EXAMPLES,
+            "icon_guidance": ICON_GUIDANCE,
+            "instructions": WIDGET_INSTRUCTIONS,
+        },
+    }
+
+    # Serialized once at import, since the JSON text for each request_type never changes either
+    SERIALIZED_RESULTS = {request_type: json.dumps(result, indent=2) for request_type, result in RESULTS.items()}
+
     def invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> str:
         """
         Provides widget schema template and examples.
@@ -295,51 +341,11 @@ class WidgetTemplateProvider(CodedTool):
         :return: JSON string containing requested information
         """
         request_type = args.get("request_type", "full")
-
-        result = {}
-
-        if request_type in ["template", "full"]:
-            result["template"] = self.WIDGET_SCHEMA_TEMPLATE
-
-        if request_type in ["examples", "full"]:
-            result["widget_type_examples"] = self.WIDGET_TYPE_EXAMPLES
-
-        if request_type in ["icons", "full"]:
-            result["icon_guidance"] = self.ICON_GUIDANCE
-
-        if request_type == "full":
-            result["instructions"] = {
-                "overview": "Generate widget definitions by filling in the template based on conversation context",
-                "widget_types": [
-                    "text - Single-line text input (default for string type)",
-                    "textarea - Multi-line text input (use x-ui.widget: 'textarea')",
-                    "number - Numeric input (type: number or integer)",
-                    "boolean - Toggle switch (type: boolean)",
-                    "checkbox - Checkbox input (type: boolean with x-ui.widget: 'checkbox')",
-                    "select - Dropdown selection (use enum array)",
-                    "radio - Radio button group (use enum with x-ui.widget: 'radio')",
-                    "multiselect - Multiple selection (type: array with items.enum)",
-                    "date - Date picker (format: 'date' or 'date-time')",
-                    "slider - Range slider (number with minimum, maximum, multipleOf)",
-                    "rating - Star rating (number with x-ui.widget: 'rating')",
-                    "file - File upload with drag-and-drop (use x-ui.widget: 'file' with accept, maxFiles, maxSize)",
-                ],
-                "key_points": [
-                    "Replace <PLACEHOLDERS> with actual values from conversation",
-                    "Remove example comments and unused optional fields",
-                    "Use appropriate field types based on data requirements",
-                    "Set 'required' array for mandatory fields",
-                    "Choose meaningful icons and colors that match the context",
-                    "Provide helpful descriptions and examples for clarity",
-                    "Field descriptions are shown as help text once - avoid redundancy",
-                    "Use format: 'date' for date pickers (no additional validation needed)",
-                    "Only add validation (minDate, maxDate) when business logic requires it",
-                    "Icons are displayed prominently - choose ones that match the widget purpose",
-                ],
-            }
-
-        return json.dumps(result, indent=2)
+        return self.SERIALIZED_RESULTS.get(request_type, "{}")
 
     async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> str:
-        """Run invoke asynchronously."""
-        return await asyncio.to_thread(self.invoke, args, sly_data)
+        """
+        Returns the same precomputed result as invoke. The work is a table lookup,
+        so it is done inline rather than paying for a worker thread hop.
+        """
+        return self.invoke(args, sly_data)
@@ -26,6 +26,7 @@ from neuro_san.interfaces.coded_tool import CodedTool
 from coded_tools.experimental.kwik_agents.list_topics import LONG_TERM_MEMORY_FILE
 from coded_tools.experimental.kwik_agents.list_topics import MEMORY_DATA_STRUCTURE
 from coded_tools.experimental.kwik_agents.list_topics import MEMORY_FILE_PATH
+from coded_tools.experimental.kwik_agents.list_topics import load_memory_file
 
 
 class CommitToMemory(CodedTool):
@@ -110,12 +111,7 @@ class CommitToMemory(CodedTool):
         Otherwise initializes an empty dictionary.
         """
         file_path = MEMORY_FILE_PATH + MEMORY_DATA_STRUCTURE + ".json"
-        if os.path.exists(file_path):
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
-                self.topic_memory = json.loads(content) if content else {}
-        else:
-            self.topic_memory = {}
+        self.topic_memory = load_memory_file(file_path)
 
     def add_memory(self, topic: str, new_fact: str) -> str:
         """
@@ -17,8 +17,10 @@
 import json
 import logging
 import os
+import threading
 from typing import Any
 from typing import Dict
+from typing import Tuple
 
 from neuro_san.interfaces.coded_tool import CodedTool
 
@@ -26,6 +28,36 @@ LONG_TERM_MEMORY_FILE = True  # Store and read memory from file
 MEMORY_FILE_PATH = "./"
 MEMORY_DATA_STRUCTURE = "TopicMemory"
 
+# Parsed memory files keyed by path, along with the (st_mtime_ns, st_size) they were parsed at
+_memory_file_cache: Dict[str, Tuple[int, int, Dict[str, str]]] = {}
+_memory_file_cache_lock = threading.Lock()
+
+
+def load_memory_file(file_path: str) -> Dict[str, str]:
+    """
+    Reads the topic memory dictionary from a JSON file, re-parsing it only when
+    the file has changed on disk since the last read.
+
+    :param file_path: Path to the topic memory JSON file
+    :return: A copy of the topic memory dictionary, or an empty dictionary if the file does not exist
+    """
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return {}
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    with _memory_file_cache_lock:
+        hit = _memory_file_cache.get(file_path)
+        if hit is None or hit[:2] != key:
+            with open(file_path, "r", encoding="utf-8") as file:
+                content = file.read()
+            hit = (*key, json.loads(content) if content else {})
+            _memory_file_cache[file_path] = hit
+
+    # Callers mutate their memory in place, so hand out a shallow copy of the cached entry
+    return dict(hit[2])
+
 
 class ListTopics(CodedTool):
     """
@@ -70,12 +102,7 @@ class ListTopics(CodedTool):
         Otherwise initializes an empty dictionary.
         """
         file_path = MEMORY_FILE_PATH + MEMORY_DATA_STRUCTURE + ".json"
-        if os.path.exists(file_path):
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
-                self.topic_memory = json.loads(content) if content else {}
-        else:
-            self.topic_memory = {}
+        self.topic_memory = load_memory_file(file_path)
 
     def get_memory_topics(self) -> str:
         """
@@ -84,4 +111,4 @@ class ListTopics(CodedTool):
         Returns:
         - list: A sorted list of all memory topics.
         """
-        return str(sorted(list(self.topic_memory.keys())))
+        return str(sorted(self.topic_memory))
@@ -15,13 +15,36 @@
 # END COPYRIGHT
 
 import logging
+from types import MappingProxyType
 from typing import Any
 from typing import Dict
+from typing import Mapping
 
 from neuro_san.interfaces.coded_tool import CodedTool
 
 logger = logging.getLogger(__name__)
 
+# Static and read-only, so built once at import rather than for every tool instance
+AIRLINE_POLICY_URLS: Mapping[str, str] = MappingProxyType(
+    {
+        "Baggage Tracking": "https://www.united.com/en/us/bagdelivery/start",
+        "Damaged Bags Claim": "https://rynnsluggage.com/",
+        "Missing Items": "https://www.united.com/en/US/fly/help/lost-and-found.html",
+        "Claims Status": "https://www.united.com/en/us/claimform/checkstatus",
+        "Carry On Baggage": "https://www.united.com/en/us/fly/baggage/carry-on-bags.html",
+        "Checked Baggage": "https://www.united.com/en/us/fly/baggage/checked-bags.html",
+        "Bag Issues": "https://www.united.com/en/us/baggage/bag-help",
+        "Special Items": "https://www.tsa.gov/travel/security-screening/whatcanibring/sporting-and-camping",
+        "Military_Personnel": "https://www.united.com/en/us/fly/company/company-info/military-benefits-and-discounts.html",  # noqa E501
+        "Mileage Plus": "https://www.united.com/en/us/fly/mileageplus.html",
+        "International Checked Baggage": "https://www.united.com/en/us/fly/baggage/international-checked-bag-limits.html",  # noqa E501
+        "International Travel Requirements": "https://www.united.com/en/us/travel/trip-planning/travel-requirements",  # noqa E501
+        "Embargoes": "https://www.united.com/en/us/fly/baggage/international-checked-bag-limits.html",
+        "Basic Economy_Restrictions": "https://www.united.com/en/us/fly/travel/inflight/basic-economy.html",
+        "Bag Fee Calculator": "https://www.united.com/en/us/checked-bag-fee-calculator/any-flights",
+    }
+)
+
 
 class URLProvider(CodedTool):
     """
@@ -32,23 +55,7 @@ class URLProvider(CodedTool):
         """
         Constructs a URL Provider for airline's intranet.
         """
-        self.airline_policy_urls = {
-            "Baggage Tracking": "https://www.united.com/en/us/bagdelivery/start",
-            "Damaged Bags Claim": "https://rynnsluggage.com/",
-            "Missing Items": "https://www.united.com/en/US/fly/help/lost-and-found.html",
-            "Claims Status": "https://www.united.com/en/us/claimform/checkstatus",
-            "Carry On Baggage": "https://www.united.com/en/us/fly/baggage/carry-on-bags.html",
-            "Checked Baggage": "https://www.united.com/en/us/fly/baggage/checked-bags.html",
-            "Bag Issues": "https://www.united.com/en/us/baggage/bag-help",
-            "Special Items": "https://www.tsa.gov/travel/security-screening/whatcanibring/sporting-and-camping",
-            "Military_Personnel": "https://www.united.com/en/us/fly/company/company-info/military-benefits-and-discounts.html",  # noqa E501
-            "Mileage Plus": "https://www.united.com/en/us/fly/mileageplus.html",
-            "International Checked Baggage": "https://www.united.com/en/us/fly/baggage/international-checked-bag-limits.html",  # noqa E501
-            "International Travel Requirements": "https://www.united.com/en/us/travel/trip-planning/travel-requirements",  # noqa E501
-            "Embargoes": "https://www.united.com/en/us/fly/baggage/international-checked-bag-limits.html",
-            "Basic Economy_Restrictions": "https://www.united.com/en/us/fly/travel/inflight/basic-economy.html",
-            "Bag Fee Calculator": "https://www.united.com/en/us/checked-bag-fee-calculator/any-flights",
-        }
+        self.airline_policy_urls = AIRLINE_POLICY_URLS
 
     def invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> str:
         """
@@ -32,7 +32,6 @@ from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 # Setup logger
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
 try:
     import nltk
@@ -35,7 +35,6 @@ from newspaper import Article
 # pylint: enable=import-error
 
 # Setup logger
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 SENSITIVE_QUERY_KEYS = {
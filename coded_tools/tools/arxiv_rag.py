@@ -23,7 +23,6 @@ from neuro_san.interfaces.coded_tool import CodedTool
 from coded_tools.tools.base_rag import BaseRag
 from coded_tools.tools.modified_arxiv_retriever import ModifiedArxivRetriever
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +42,11 @@ VECTOR_SIZE = 1536
 
 logger = logging.getLogger(__name__)
 
+# Contents of in-memory vector stores loaded from JSON files, keyed by path along with
+# the (st_mtime_ns, st_size) they were loaded at. Only the store dict is kept so that
+# each call wraps it with its own embeddings client.
+_loaded_vector_stores: dict[str, tuple[int, int, dict[str, dict[str, Any]]]] = {}
+
 
 @dataclass
 class PostgresConfig:
@@ -150,14 +155,33 @@ class BaseRag(ABC):
         return vectorstore
 
     async def _load_existing_vector_store(self) -> Optional[VectorStore]:
-        """Try to load existing vector store from file."""
+        """Try to load existing vector store from file, reusing it across calls until the file changes."""
 
         if not self.abs_vector_store_path:
             return None
 
         try:
-            vector_store: VectorStore = InMemoryVectorStore.load(
-                path=self.abs_vector_store_path, embedding=self.embeddings
+            stat: os.stat_result = os.stat(self.abs_vector_store_path)
+
+            # Reuse the store contents from a previous call unless the file has been rewritten since
+            cached: Optional[tuple[int, int, dict[str, dict[str, Any]]]] = _loaded_vector_stores.get(
+                self.abs_vector_store_path
+            )
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                logger.info("Using cached vector store from: %s\n", self.abs_vector_store_path)
+                vector_store: InMemoryVectorStore = InMemoryVectorStore(embedding=self.embeddings)
+                # Copy the outer dict so documents added to this store do not leak into the cache
+                vector_store.store = dict(cached[2])
+                return vector_store
+
+            # Parsing the JSON file is blocking, so keep it off the event loop
+            vector_store = await asyncio.to_thread(
+                InMemoryVectorStore.load, path=self.abs_vector_store_path, embedding=self.embeddings
+            )
+            _loaded_vector_stores[self.abs_vector_store_path] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                dict(vector_store.store),
             )
             logger.info("Loaded vector store from: %s\n", self.abs_vector_store_path)
             return vector_store
@@ -283,7 +307,7 @@ class BaseRag(ABC):
 
         try:
             os.makedirs(os.path.dirname(self.abs_vector_store_path), exist_ok=True)
-            vectorstore.dump(path=self.abs_vector_store_path)
+            await asyncio.to_thread(vectorstore.dump, path=self.abs_vector_store_path)
             logger.info("Vector store saved to: %s\n", self.abs_vector_store_path)
         except OSError as os_error:
             logger.error("Failed to save vector store to %s: %s\n", self.abs_vector_store_path, os_error)
@@ -34,7 +34,6 @@ from coded_tools.tools.base_rag import BaseRag
 
 INVALID_PATH_PATTERN = r"[<>:\"|?*\x00-\x1F]"
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -20,16 +20,12 @@ from typing import Any
 
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStore
-
-# pylint: disable=import-error
-from langchain_docling import DoclingLoader
 from neuro_san.interfaces.coded_tool import CodedTool
 from requests.exceptions import HTTPError
 
 from coded_tools.tools.base_rag import BaseRag
 from coded_tools.tools.base_rag import PostgresConfig
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -113,6 +109,11 @@ class DoclingRag(CodedTool, BaseRag):
         :param loader_args: Dictionary containing 'urls' (list of file URLs)
         :return: List of loaded documents
         """
+        # Do lazy import so that docling and its models are only loaded once documents are actually requested
+        # pylint: disable=import-error
+        # pylint: disable=import-outside-toplevel
+        from langchain_docling import DoclingLoader
+
         docs: list[Document] = []
         urls: list[str] = loader_args.get("urls", [])
 
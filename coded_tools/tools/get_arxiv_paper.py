@@ -20,7 +20,6 @@ from typing import Dict
 
 from neuro_san.interfaces.coded_tool import CodedTool
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -18,6 +18,7 @@ import os
 from logging import getLogger
 from typing import Any
 from typing import Iterator
+from typing import Optional
 
 # pylint: disable=import-error
 from arxiv import SortCriterion
@@ -36,6 +37,7 @@ class ModifiedArxivAPIWrapper(ArxivAPIWrapper):
 
     - Add `sort_by` and `sort_order` attribute
     - Move `Entry ID` to main metadata when `get_full_documents` is True
+    - Stop extracting PDF text once `doc_content_chars_max` characters have been read
 
     From
     https://github.com/langchain-ai/langchain-community/blob/main/libs/community/langchain_community/utilities/arxiv.py
@@ -80,6 +82,26 @@ class ModifiedArxivAPIWrapper(ArxivAPIWrapper):
             sort_order=sort_order_enum,
         ).results()
 
+    def _get_pdf_text(self, doc_file: Any) -> str:
+        """
+        Concatenate the text of the pages of an open PDF, up to doc_content_chars_max characters.
+        Pages are trimmed to the remaining budget as they are read, so neither the page extraction
+        nor the join goes past the limit.
+
+        :param doc_file: An open fitz document
+        """
+        pages: list[str] = []
+        remaining: Optional[int] = self.doc_content_chars_max
+        for page in doc_file:
+            page_text: str = page.get_text()
+            if remaining is not None:
+                page_text = page_text[:remaining]
+                remaining -= len(page_text)
+            pages.append(page_text)
+            if remaining is not None and remaining <= 0:
+                break
+        return "".join(pages)
+
     def lazy_load(self, query: str) -> Iterator[Document]:
         """
         Run Arxiv search and get the article texts plus the article meta information.
@@ -110,7 +132,7 @@ class ModifiedArxivAPIWrapper(ArxivAPIWrapper):
             try:
                 doc_file_name: str = result.download_pdf()
                 with fitz.open(doc_file_name) as doc_file:
-                    text: str = "".join(page.get_text() for page in doc_file)
+                    text: str = self._get_pdf_text(doc_file)
             except (FileNotFoundError, fitz.fitz.FileDataError) as f_ex:
                 logger.debug(f_ex)
                 continue
@@ -139,5 +161,5 @@ class ModifiedArxivAPIWrapper(ArxivAPIWrapper):
                 "Summary": result.summary,
                 **extra_metadata,
             }
-            yield Document(page_content=text[: self.doc_content_chars_max], metadata=metadata)
+            yield Document(page_content=text, metadata=metadata)
             os.remove(doc_file_name)
@@ -16,13 +16,13 @@
 
 """Tool module for doing RAG from a pdf file"""
 
+import asyncio
 import logging
 import os
 from typing import Any
 from typing import Dict
 from typing import List
 
-from langchain_community.document_loaders import PyMuPDFLoader
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStore
 from neuro_san.interfaces.coded_tool import CodedTool
@@ -30,7 +30,6 @@ from neuro_san.interfaces.coded_tool import CodedTool
 from coded_tools.tools.base_rag import BaseRag
 from coded_tools.tools.base_rag import PostgresConfig
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -112,18 +111,39 @@ class PdfRag(CodedTool, BaseRag):
         :param loader_args: Dictionary containing 'urls' (list of PDF file URLs)
         :return: List of loaded PDF documents
         """
-        docs: List[Document] = []
         urls: List[str] = loader_args.get("urls", [])
 
+        # Load the PDFs one after another since PyMuPDF is not thread-safe
+        docs: List[Document] = []
         for url in urls:
-            try:
-                loader = PyMuPDFLoader(file_path=url)
-                doc: List[Document] = await loader.aload()
-                docs.extend(doc)
-                logger.info("Successfully loaded PDF file from %s", url)
-            except FileNotFoundError:
-                logger.error("File not found: %s", url)
-            except ValueError as e:
-                logger.error("Invalid file path or unsupported input: %s – %s", url, e)
+            docs.extend(await self.load_pdf(url))
 
         return docs
+
+    @staticmethod
+    async def load_pdf(url: str) -> List[Document]:
+        """
+        Load a single PDF document.
+
+        :param url: PDF file URL or path
+        :return: List of documents, one per page, or an empty list if the PDF could not be loaded
+        """
+        # Do lazy import so that PyMuPDF is only loaded once a PDF is actually requested
+        # pylint: disable=import-outside-toplevel
+        from langchain_community.document_loaders import PyMuPDFLoader
+
+        try:
+            # Parse the whole file in one worker thread; aload() would hop to the executor once per page
+            loader = PyMuPDFLoader(file_path=url)
+            docs: List[Document] = await asyncio.to_thread(loader.load)
+            logger.info("Successfully loaded PDF file from %s", url)
+            return docs
+        except FileNotFoundError:
+            logger.error("File not found: %s", url)
+        except ValueError as e:
+            logger.error("Invalid file path or unsupported input: %s – %s", url, e)
+        except RuntimeError as e:
+            # PyMuPDF raises FileDataError, a RuntimeError, for corrupt or empty files
+            logger.error("Failed to parse PDF file: %s – %s", url, e)
+
+        return []
@@ -23,7 +23,6 @@ from neuro_san.interfaces.coded_tool import CodedTool
 
 from coded_tools.tools.base_rag import BaseRag
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
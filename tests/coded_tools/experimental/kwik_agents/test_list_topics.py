@@ -0,0 +1,98 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from coded_tools.experimental.kwik_agents import list_topics
+from coded_tools.experimental.kwik_agents.commit_to_memory import CommitToMemory
+from coded_tools.experimental.kwik_agents.list_topics import MEMORY_DATA_STRUCTURE
+from coded_tools.experimental.kwik_agents.list_topics import load_memory_file
+
+
+class TestLoadMemoryFile(TestCase):
+    """
+    Unit tests for the load_memory_file helper shared by the kwik_agents memory tools.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.memory_dir = self.temp_dir.name + os.sep
+        self.file_path = self.memory_dir + MEMORY_DATA_STRUCTURE + ".json"
+        list_topics._memory_file_cache.clear()  # pylint: disable=protected-access
+
+    def tearDown(self):
+        list_topics._memory_file_cache.clear()  # pylint: disable=protected-access
+        self.temp_dir.cleanup()
+
+    def _write(self, content: str):
+        with open(self.file_path, "w", encoding="utf-8") as file:
+            file.write(content)
+
+    def test_missing_file(self):
+        """
+        A missing memory file reads as an empty memory.
+        """
+        self.assertDictEqual({}, load_memory_file(self.file_path))
+
+    def test_empty_file(self):
+        """
+        An empty memory file reads as an empty memory.
+        """
+        self._write("")
+        self.assertDictEqual({}, load_memory_file(self.file_path))
+
+    def test_unchanged_file_uses_cached_parse(self):
+        """
+        An unchanged file is not parsed again.
+        """
+        self._write(json.dumps({"cats": "Cats purr."}))
+        first = load_memory_file(self.file_path)
+
+        with patch.object(list_topics.json, "loads") as mock_loads:
+            second = load_memory_file(self.file_path)
+            mock_loads.assert_not_called()
+
+        self.assertDictEqual({"cats": "Cats purr."}, first)
+        self.assertDictEqual(first, second)
+
+    def test_refreshes_after_commit_to_memory_write(self):
+        """
+        The cache picks up a file rewritten by CommitToMemory.
+        """
+        self._write(json.dumps({"cats": "Cats purr."}))
+        self.assertDictEqual({"cats": "Cats purr."}, load_memory_file(self.file_path))
+
+        commit_to_memory = CommitToMemory()
+        commit_to_memory.topic_memory = {"cats": "Cats purr.", "dogs": "Dogs bark."}
+        with patch("coded_tools.experimental.kwik_agents.commit_to_memory.MEMORY_FILE_PATH", self.memory_dir):
+            commit_to_memory.write_memory_to_file()
+
+        self.assertDictEqual({"cats": "Cats purr.", "dogs": "Dogs bark."}, load_memory_file(self.file_path))
+
+    def test_returned_dict_is_a_copy(self):
+        """
+        Mutating the returned memory does not change what later callers see.
+        """
+        self._write(json.dumps({"cats": "Cats purr."}))
+        memory = load_memory_file(self.file_path)
+        memory["dogs"] = "Dogs bark."
+        memory["cats"] = "Changed."
+
+        self.assertDictEqual({"cats": "Cats purr."}, load_memory_file(self.file_path))
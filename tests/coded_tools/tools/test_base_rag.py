@@ -0,0 +1,114 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from typing import Any
+from unittest import TestCase
+from unittest.mock import patch
+
+from langchain_community.vectorstores import InMemoryVectorStore
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from coded_tools.tools import base_rag
+from coded_tools.tools.base_rag import BaseRag
+
+
+class StubRag(BaseRag):
+    """
+    Minimal BaseRag that uses fake embeddings instead of calling OpenAI.
+    """
+
+    def __init__(self):
+        with patch("coded_tools.tools.base_rag.OpenAIEmbeddings"):
+            super().__init__()
+        self.embeddings = DeterministicFakeEmbedding(size=8)
+
+    async def load_documents(self, loader_args: Any) -> list[Document]:
+        return []
+
+
+class TestLoadExistingVectorStore(TestCase):
+    """
+    Unit tests for the cache of vector stores loaded from JSON files in BaseRag.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.file_path = os.path.join(self.temp_dir.name, "vector_store.json")
+        base_rag._loaded_vector_stores.clear()  # pylint: disable=protected-access
+
+    def tearDown(self):
+        base_rag._loaded_vector_stores.clear()  # pylint: disable=protected-access
+        self.temp_dir.cleanup()
+
+    def _write(self, texts: list[str]):
+        vector_store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=8))
+        vector_store.add_texts(texts)
+        vector_store.dump(self.file_path)
+
+    def _load(self) -> tuple[StubRag, InMemoryVectorStore]:
+        rag = StubRag()
+        rag.configure_vector_store_path(self.file_path)
+        # pylint: disable=protected-access
+        return rag, asyncio.run(rag._load_existing_vector_store())
+
+    @staticmethod
+    def _texts(vector_store: InMemoryVectorStore) -> list[str]:
+        return sorted(entry["text"] for entry in vector_store.store.values())
+
+    def test_unchanged_file_is_not_reloaded(self):
+        """
+        A second load of an unchanged file reuses the cached contents with the caller's embeddings.
+        """
+        self._write(["alpha", "beta"])
+
+        with patch.object(InMemoryVectorStore, "load", wraps=InMemoryVectorStore.load) as mock_load:
+            _, first = self._load()
+            rag, second = self._load()
+
+        self.assertEqual(1, mock_load.call_count)
+        self.assertIsNot(first, second)
+        self.assertIs(rag.embeddings, second.embedding)
+        self.assertListEqual(["alpha", "beta"], self._texts(second))
+
+    def test_rewritten_file_is_reloaded(self):
+        """
+        Rewriting the file invalidates the cached contents.
+        """
+        self._write(["alpha", "beta"])
+
+        with patch.object(InMemoryVectorStore, "load", wraps=InMemoryVectorStore.load) as mock_load:
+            self._load()
+            self._write(["gamma"])
+            _, reloaded = self._load()
+
+        self.assertEqual(2, mock_load.call_count)
+        self.assertListEqual(["gamma"], self._texts(reloaded))
+
+    def test_added_documents_do_not_leak_into_cache(self):
+        """
+        Documents added to a store served from the cache are not seen by later loads.
+        """
+        self._write(["alpha"])
+
+        _, first = self._load()
+        first.add_texts(["extra"])
+        _, second = self._load()
+
+        self.assertListEqual(["alpha"], self._texts(second))